@@ -0,0 +1,141 @@
+"""
+Dashboard Chart Data
+Pre-aggregates BudgetState histories into small series for the Dashboard charts
+
+Excel redraws every point a chart references, so long histories are cut down
+to a fixed number of points with Largest-Triangle-Three-Buckets (LTTB), which
+keeps the peaks and dips that give a line its shape. Chart cost then depends
+on CHART_POINTS, not on how many years of data there are.
+
+Bar charts only have a category axis, which spaces points evenly whatever
+their dates. Series that change at irregular times (net worth) are sampled
+at evenly spaced month-ends instead, carrying each value forward.
+"""
+
+import calendar
+from collections import defaultdict
+from datetime import date, datetime
+
+CHART_POINTS = 120
+PIE_SLICES = 8
+
+CATEGORY_LABELS = {
+    'rent': 'Rent',
+    'power': 'Power',
+    'internet': 'Internet',
+    'gas': 'Gas (Utilities)',
+    'groceries': 'Groceries',
+    'gym': 'Gym',
+    'creditCard': 'Credit Card',
+    'funMoney': 'Fun Money',
+    'other': 'Other',
+}
+
+
+def lttb(points, threshold=CHART_POINTS):
+    """Downsample [(x, y), ...] (sorted by x) to at most `threshold` points."""
+    if threshold < 3 or len(points) <= threshold:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third corner of the triangle
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        count = next_end - next_start
+        avg_x = sum(p[0] for p in points[next_start:next_end]) / count
+        avg_y = sum(p[1] for p in points[next_start:next_end]) / count
+
+        ax, ay = points[a]
+        best, best_area = start, -1
+        for j in range(start, end):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def parse_date(value):
+    """Dates from the app are ISO (2025-01-24); the old sheet used 01/24/2025."""
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.strptime(value[:10], '%m/%d/%Y').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def downsample_by_date(series, threshold=CHART_POINTS):
+    """LTTB over [(date, value), ...], using day numbers as the x axis."""
+    points = sorted((d.toordinal(), v) for d, v in series)
+    return [(date.fromordinal(int(x)), v) for x, v in lttb(points, threshold)]
+
+
+def month_ends(start, end, limit=CHART_POINTS):
+    """At most `limit` evenly spaced month-ends from start's month to `end`.
+
+    Spacing is counted back from end's month so the latest month is always
+    included. That month is cut off at `end` itself.
+    """
+    months = (end.year - start.year) * 12 + end.month - start.month + 1
+    step = -(-months // limit)
+    days = []
+    for back in range((months - 1) // step * step, -1, -step):
+        year, month = divmod(end.year * 12 + end.month - 1 - back, 12)
+        month_end = date(year, month + 1, calendar.monthrange(year, month + 1)[1])
+        days.append(min(month_end, end))
+    return days
+
+
+def carry_forward(series, days):
+    """[(day, value), ...] with the value in effect on each of `days` (both sorted).
+
+    Days before the first point in `series` are left out.
+    """
+    result = []
+    i = -1
+    for day in days:
+        while i + 1 < len(series) and series[i + 1][0] <= day:
+            i += 1
+        if i >= 0:
+            result.append((day, series[i][1]))
+    return result
+
+
+def spending_by_category(transactions, custom_categories=(), limit=PIE_SLICES):
+    """[(label, total), ...] largest first, with the tail folded into "Everything Else"."""
+    labels = dict(CATEGORY_LABELS)
+    labels.update({c['id']: c['label'] for c in custom_categories})
+
+    totals = defaultdict(float)
+    for t in transactions:
+        totals[labels.get(t['category'], t['category'])] += t['amount']
+
+    ranked = sorted(((label, round(total, 2)) for label, total in totals.items() if total > 0),
+                    key=lambda item: item[1], reverse=True)
+    if len(ranked) > limit:
+        rest = round(sum(total for _, total in ranked[limit - 1:]), 2)
+        ranked = ranked[:limit - 1] + [("Everything Else", rest)]
+    return ranked
+
+
+def paycheck_series(paychecks):
+    """[(pay date, net pay), ...] for every paycheck with a readable date."""
+    series = []
+    for p in paychecks:
+        day = parse_date(p.get('payDate'))
+        if day is not None:
+            series.append((day, p.get('net', 0)))
+    return series
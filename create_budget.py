@@ -1,18 +1,111 @@
 """
 Budget Master Spreadsheet Creator
 Creates a comprehensive budget management Excel workbook
+
+Run directly to build the workbook from the built-in defaults, or pass the
+desktop app's budget-data.json to build it from saved data (this also adds a
+net worth snapshot to net_worth_history.db next to the data file):
+
+    python create_budget.py [path/to/budget-data.json] [--output Budget_Master.xlsx]
+
+The workbook is written next to the data file, or to the current folder when
+no data file is given, unless --output says otherwise.
 """
 
+import argparse
+import copy
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, numbers
 from openpyxl.utils import get_column_letter
 from openpyxl.chart import PieChart, BarChart, Reference
 from openpyxl.chart.label import DataLabelList
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from openpyxl.formatting.rule import FormulaRule
 
-# Create workbook
-wb = Workbook()
+from chart_data import (
+    CATEGORY_LABELS, CHART_POINTS, carry_forward, downsample_by_date, month_ends, paycheck_series,
+    spending_by_category,
+)
+from networth_history import NetWorthHistory, account_labels, balances_from_state, balances_on, history_path_for
+
+OUTPUT_NAME = "Budget_Master.xlsx"
+
+# Defaults used when no budget-data.json is given (same shape as BudgetState
+# in budget-app/src/types/budget.ts)
+DEFAULT_STATE = {
+    'config': {
+        'annualSalary': 76000,
+        'netPayPerPaycheck': 1920,
+        'roth401kPerPaycheck': 253.33,
+        'hsaPerPaycheck': 126.67,
+        'employerMatchPercent': 8,
+        'rent': 1815,
+        'power': 120,
+        'internet': 51.16,
+        'gas': 50,
+        'groceries': 145,
+        'gym': 0,
+        'rothIraMonthly': 583.33,
+        'emergencyFundMonthly': 850,
+        'brokerageMonthly': 100,
+        'funMoneyMonthly': 150,
+        'emergencyFundTarget': 15000,
+        'rothIraAnnualLimit': 7000,
+    },
+    'creditCard': {
+        'totalAmount': 920,
+        'monthlyPayment': 230,
+        'payments': [
+            {'id': str(m), 'month': m, 'amount': 230, 'paid': False} for m in range(1, 5)
+        ],
+    },
+    'workExpenses': [
+        {'id': '1', 'date': '01/15/2025', 'description': 'Client lunch - Project X', 'category': 'Meals',
+         'amount': 45.00, 'hasReceipt': True, 'status': 'Pending', 'expectedReimbursementDate': '02/01/2025'},
+        {'id': '2', 'date': '01/18/2025', 'description': 'Uber to client site', 'category': 'Travel',
+         'amount': 28.50, 'hasReceipt': True, 'status': 'Pending', 'expectedReimbursementDate': '02/01/2025'},
+    ],
+    'rothIraContributions': [
+        {'id': '1', 'month': 'January', 'amount': 583.33},
+    ],
+    'emergencyFundEntries': [],
+    'emergencyFundBalance': 0,
+    'savingsFunds': [],
+    'fundTransactions': [],
+    'paychecks': [
+        {'id': '1', 'payDate': '01/24/2025', 'gross': 3250.01, 'net': 2162.76, 'hours': 96,
+         'rothIra': 291.67, 'emergencyFund': 375, 'brokerage': 50, 'notes': 'Extra hours'},
+    ],
+    'budgetTransactions': [],
+    'customCategories': [],
+    'monthlyBudgetOverrides': [],
+}
+
+
+def output_path_for(data_path=None):
+    """Default workbook location: next to budget-data.json, else the current folder."""
+    return Path(data_path).with_name(OUTPUT_NAME) if data_path else Path(OUTPUT_NAME)
+
+
+def load_state(path):
+    """Read budget-data.json and fill in anything missing from DEFAULT_STATE."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    state = copy.deepcopy(DEFAULT_STATE)
+    if not data:  # the app writes "null" when data is cleared
+        return state
+    for key in state:
+        if key in data:
+            state[key] = data[key]
+    state['config'] = {**DEFAULT_STATE['config'], **(data.get('config') or {})}
+    return state
+
 
 # Styles
 header_font = Font(bold=True, size=12, color="FFFFFF")
@@ -47,673 +140,995 @@ def style_cell(cell, is_money=False, is_percent=False):
 # ============================================
 # SHEET 1: DASHBOARD
 # ============================================
-ws = wb.active
-ws.title = "Dashboard"
-
-# Title
-ws.merge_cells('A1:H1')
-ws['A1'] = "💰 BUDGET DASHBOARD - Joshua's Financial Command Center"
-ws['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws['A1'].alignment = Alignment(horizontal='center')
-
-# Income Summary Section
-ws['A3'] = "INCOME SUMMARY"
-ws['A3'].font = Font(bold=True, size=14)
-ws.merge_cells('A3:D3')
-
-headers = ['Category', 'Annual', 'Monthly', 'Per Paycheck']
-for i, h in enumerate(headers, 1):
-    cell = ws.cell(row=4, column=i, value=h)
-    style_header(cell)
-
-income_data = [
-    ['Gross Salary', 76000, '=B5/12', '=B5/26'],
-    ['Net Pay (After Deductions)', '=C6*12', 4160, 1920],
-]
-for r, row_data in enumerate(income_data, 5):
-    for c, val in enumerate(row_data, 1):
-        cell = ws.cell(row=r, column=c, value=val)
+def build_dashboard(ws, state, derived):
+    config = state['config']
+
+    # Title
+    ws.merge_cells('A1:H1')
+    ws['A1'] = "💰 BUDGET DASHBOARD - Joshua's Financial Command Center"
+    ws['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws['A1'].alignment = Alignment(horizontal='center')
+
+    # Income Summary Section
+    ws['A3'] = "INCOME SUMMARY"
+    ws['A3'].font = Font(bold=True, size=14)
+    ws.merge_cells('A3:D3')
+
+    headers = ['Category', 'Annual', 'Monthly', 'Per Paycheck']
+    for i, h in enumerate(headers, 1):
+        cell = ws.cell(row=4, column=i, value=h)
+        style_header(cell)
+
+    net_pay = config['netPayPerPaycheck']
+    income_data = [
+        ['Gross Salary', config['annualSalary'], '=B5/12', '=B5/26'],
+        ['Net Pay (After Deductions)', '=C6*12', round(net_pay * 26 / 12, 2), net_pay],
+    ]
+    for r, row_data in enumerate(income_data, 5):
+        for c, val in enumerate(row_data, 1):
+            cell = ws.cell(row=r, column=c, value=val)
+            style_cell(cell, is_money=(c > 1))
+
+    # Paycheck Deductions (already taken out)
+    ws['A8'] = "AUTOMATIC PAYCHECK DEDUCTIONS (Already Deducted)"
+    ws['A8'].font = Font(bold=True, size=14)
+    ws.merge_cells('A8:D8')
+
+    for i, h in enumerate(['Deduction', 'Per Paycheck', 'Monthly', 'Annual'], 1):
+        cell = ws.cell(row=9, column=i, value=h)
+        style_header(cell)
+
+    deductions = [
+        ['Roth 401(k) - Your 8%', config['roth401kPerPaycheck'], '=B10*26/12', '=B10*26'],
+        ['HSA', config['hsaPerPaycheck'], '=B11*26/12', '=B11*26'],
+        ['Fed Withholding', 319.22, '=B12*26/12', '=B12*26'],
+        ['Fed Med/OASDI', 238.94, '=B13*26/12', '=B13*26'],
+        ['CA Withholding', 136.15, '=B14*26/12', '=B14*26'],
+        ['Disability Ins', 12.94, '=B15*26/12', '=B15*26'],
+        ['TOTAL DEDUCTIONS', '=SUM(B10:B15)', '=SUM(C10:C15)', '=SUM(D10:D15)'],
+    ]
+    for r, row_data in enumerate(deductions, 10):
+        for c, val in enumerate(row_data, 1):
+            cell = ws.cell(row=r, column=c, value=val)
+            style_cell(cell, is_money=(c > 1))
+            if r == 16:
+                cell.font = Font(bold=True)
+
+    # FREE MONEY Section
+    ws['A18'] = "🎁 FREE MONEY (Employer Contributions)"
+    ws['A18'].font = Font(bold=True, size=14, color="228B22")
+    ws.merge_cells('A18:D18')
+
+    for i, h in enumerate(['Benefit', 'Per Paycheck', 'Monthly', 'Annual'], 1):
+        cell = ws.cell(row=19, column=i, value=h)
+        style_header(cell)
+
+    match_percent = config['employerMatchPercent']
+    ws.cell(row=20, column=1, value=f"Employer 401(k) Match ({match_percent:g}%)")
+    ws.cell(row=20, column=2, value=f'=B5*{match_percent / 100:g}/26')
+    ws.cell(row=20, column=3, value='=B20*26/12')
+    ws.cell(row=20, column=4, value='=B20*26')
+    for c in range(1, 5):
+        cell = ws.cell(row=20, column=c)
         style_cell(cell, is_money=(c > 1))
+        cell.fill = green_fill
+
+    # Key Financial Stats
+    ws['F3'] = "KEY STATS"
+    ws['F3'].font = Font(bold=True, size=14)
+    ws.merge_cells('F3:H3')
+
+    stats = [
+        ['Total Retirement Savings/Year', '=D10+D11+D20', '(401k + HSA + Employer)'],
+        ['Retirement % of Gross', '=G4/B5', ''],
+        ['Effective Tax Rate', '=(D12+D14)/B5', ''],
+        ['Take-Home Rate', '=C6*12/B5', ''],
+    ]
+    for r, (label, val, note) in enumerate(stats, 4):
+        ws.cell(row=r, column=6, value=label).font = Font(bold=True)
+        cell = ws.cell(row=r, column=7, value=val)
+        if r == 5 or r == 6 or r == 7:
+            style_cell(cell, is_percent=True)
+        else:
+            style_cell(cell, is_money=True)
+        ws.cell(row=r, column=8, value=note).font = Font(italic=True, color="666666")
+
+    # Column widths
+    ws.column_dimensions['A'].width = 35
+    ws.column_dimensions['B'].width = 15
+    ws.column_dimensions['C'].width = 15
+    ws.column_dimensions['D'].width = 15
+    ws.column_dimensions['F'].width = 30
+    ws.column_dimensions['G'].width = 15
+    ws.column_dimensions['H'].width = 25
+
+    # Charts (data comes from the hidden "Chart Data" sheet)
+    series = derived['charts']
+    ws['A22'] = "📊 CHARTS"
+    ws['A22'].font = Font(bold=True, size=14)
+
+    n = len(series['spending'])
+    if n:
+        pie = PieChart()
+        pie.title = series['spending_title']
+        pie.add_data(Reference(range_string=f"'Chart Data'!$B$1:$B${n + 1}"), titles_from_data=True)
+        pie.set_categories(Reference(range_string=f"'Chart Data'!$A$2:$A${n + 1}"))
+        pie.dataLabels = DataLabelList()
+        pie.dataLabels.showPercent = True
+        ws.add_chart(pie, 'A24')
+
+    bars = [
+        ("Net Worth Over Time", 'D', 'E', series['net_worth'], 'F24'),
+        ("Net Pay by Paycheck", 'G', 'H', series['paychecks'], 'A41'),
+    ]
+    for title, date_col, value_col, points, anchor in bars:
+        if not points:
+            continue
+        n = len(points)
+        bar = BarChart()
+        bar.type = 'col'
+        bar.title = title
+        bar.legend = None
+        bar.gapWidth = 20
+        bar.y_axis.numFmt = '"$"#,##0'
+        # openpyxl 3.1 leaves axes deleted unless told otherwise
+        bar.x_axis.delete = False
+        bar.y_axis.delete = False
+        bar.x_axis.number_format = 'MMM YYYY'
+        bar.add_data(Reference(range_string=f"'Chart Data'!${value_col}$1:${value_col}${n + 1}"), titles_from_data=True)
+        bar.set_categories(Reference(range_string=f"'Chart Data'!${date_col}$2:${date_col}${n + 1}"))
+        bar.width = 18
+        ws.add_chart(bar, anchor)
 
-# Paycheck Deductions (already taken out)
-ws['A8'] = "AUTOMATIC PAYCHECK DEDUCTIONS (Already Deducted)"
-ws['A8'].font = Font(bold=True, size=14)
-ws.merge_cells('A8:D8')
-
-for i, h in enumerate(['Deduction', 'Per Paycheck', 'Monthly', 'Annual'], 1):
-    cell = ws.cell(row=9, column=i, value=h)
-    style_header(cell)
-
-deductions = [
-    ['Roth 401(k) - Your 8%', 253.33, '=B10*26/12', '=B10*26'],
-    ['HSA', 126.67, '=B11*26/12', '=B11*26'],
-    ['Fed Withholding', 319.22, '=B12*26/12', '=B12*26'],
-    ['Fed Med/OASDI', 238.94, '=B13*26/12', '=B13*26'],
-    ['CA Withholding', 136.15, '=B14*26/12', '=B14*26'],
-    ['Disability Ins', 12.94, '=B15*26/12', '=B15*26'],
-    ['TOTAL DEDUCTIONS', '=SUM(B10:B15)', '=SUM(C10:C15)', '=SUM(D10:D15)'],
-]
-for r, row_data in enumerate(deductions, 10):
-    for c, val in enumerate(row_data, 1):
-        cell = ws.cell(row=r, column=c, value=val)
-        style_cell(cell, is_money=(c > 1))
-        if r == 16:
-            cell.font = Font(bold=True)
-
-# FREE MONEY Section
-ws['A18'] = "🎁 FREE MONEY (Employer Contributions)"
-ws['A18'].font = Font(bold=True, size=14, color="228B22")
-ws.merge_cells('A18:D18')
-
-for i, h in enumerate(['Benefit', 'Per Paycheck', 'Monthly', 'Annual'], 1):
-    cell = ws.cell(row=19, column=i, value=h)
-    style_header(cell)
-
-ws.cell(row=20, column=1, value="Employer 401(k) Match (8%)")
-ws.cell(row=20, column=2, value='=76000*0.08/26')
-ws.cell(row=20, column=3, value='=B20*26/12')
-ws.cell(row=20, column=4, value='=B20*26')
-for c in range(1, 5):
-    cell = ws.cell(row=20, column=c)
-    style_cell(cell, is_money=(c > 1))
-    cell.fill = green_fill
-
-# Key Financial Stats
-ws['F3'] = "KEY STATS"
-ws['F3'].font = Font(bold=True, size=14)
-ws.merge_cells('F3:H3')
-
-stats = [
-    ['Total Retirement Savings/Year', '=D10+D11+D20', '(401k + HSA + Employer)'],
-    ['Retirement % of Gross', '=F4/76000', ''],
-    ['Effective Tax Rate', '=(D12+D14)/76000', ''],
-    ['Take-Home Rate', '=C6*12/76000', ''],
-]
-for r, (label, val, note) in enumerate(stats, 4):
-    ws.cell(row=r, column=6, value=label).font = Font(bold=True)
-    cell = ws.cell(row=r, column=7, value=val)
-    if r == 5 or r == 6 or r == 7:
-        style_cell(cell, is_percent=True)
-    else:
+# ============================================
+# SHEET 2: MONTHLY BUDGET
+# ============================================
+def build_monthly_budget(ws2, state, derived):
+    config = state['config']
+    credit_card = state['creditCard']
+
+    ws2['A1'] = "MONTHLY BUDGET PLANNER"
+    ws2['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws2.merge_cells('A1:E1')
+
+    # Income Section
+    ws2['A3'] = "MONTHLY INCOME"
+    ws2['A3'].font = Font(bold=True, size=12)
+    style_header(ws2['A3'])
+    ws2.merge_cells('A3:C3')
+
+    net_monthly = round(config['netPayPerPaycheck'] * 26 / 12, 2)
+    ws2['A4'] = "Net Monthly Income (avg)"
+    ws2['B4'] = net_monthly
+    ws2['C4'] = f"Based on ${config['netPayPerPaycheck']:,.0f} x 26 / 12"
+    style_cell(ws2['B4'], is_money=True)
+
+    # Fixed Expenses
+    ws2['A6'] = "FIXED EXPENSES (Non-Negotiable)"
+    ws2['A6'].font = Font(bold=True, size=12)
+    style_header(ws2['A6'])
+    ws2.merge_cells('A6:C6')
+
+    payments_left = sum(1 for p in credit_card['payments'] if not p.get('paid'))
+    fixed_expenses = [
+        ['Rent', config['rent'], 'Fixed'],
+        ['Power', config['power'], 'Estimate'],
+        ['Internet', config['internet'], 'Fixed'],
+        ['Gas (Utilities)', config['gas'], 'Estimate'],
+        ['Groceries', config['groceries'], 'Budget'],
+        ['Credit Card Payment', credit_card['monthlyPayment'], f'{payments_left} months remaining'],
+    ]
+
+    for i, h in enumerate(['Expense', 'Amount', 'Notes'], 1):
+        cell = ws2.cell(row=7, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
+
+    for r, (exp, amt, note) in enumerate(fixed_expenses, 8):
+        ws2.cell(row=r, column=1, value=exp).border = thin_border
+        cell = ws2.cell(row=r, column=2, value=amt)
         style_cell(cell, is_money=True)
-    ws.cell(row=r, column=8, value=note).font = Font(italic=True, color="666666")
+        ws2.cell(row=r, column=3, value=note).border = thin_border
+
+    ws2['A14'] = "TOTAL FIXED"
+    ws2['A14'].font = Font(bold=True)
+    ws2['B14'] = '=SUM(B8:B13)'
+    style_cell(ws2['B14'], is_money=True)
+    ws2['B14'].font = Font(bold=True)
+
+    # After Fixed
+    ws2['A16'] = "REMAINING AFTER FIXED"
+    ws2['A16'].font = Font(bold=True, size=12, color="228B22")
+    ws2['B16'] = '=B4-B14'
+    style_cell(ws2['B16'], is_money=True)
+    ws2['B16'].font = Font(bold=True, size=12)
+    ws2['B16'].fill = green_fill
+
+    # Savings Allocation (from remaining)
+    ws2['A18'] = "SAVINGS ALLOCATION (From Remaining)"
+    ws2['A18'].font = Font(bold=True, size=12)
+    style_header(ws2['A18'])
+    ws2.merge_cells('A18:D18')
+
+    for i, h in enumerate(['Category', 'Monthly', '% of Remaining', 'Purpose'], 1):
+        cell = ws2.cell(row=19, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-# Column widths
-ws.column_dimensions['A'].width = 35
-ws.column_dimensions['B'].width = 15
-ws.column_dimensions['C'].width = 15
-ws.column_dimensions['D'].width = 15
-ws.column_dimensions['F'].width = 30
-ws.column_dimensions['G'].width = 15
-ws.column_dimensions['H'].width = 25
+    # Whatever isn't allocated goes to the buffer so the balance check lands on $0
+    remaining = net_monthly - sum(amt for _, amt, _ in fixed_expenses)
+    allocated = (config['rothIraMonthly'] + config['emergencyFundMonthly']
+                 + config['brokerageMonthly'] + config['funMoneyMonthly'])
+    buffer = max(round(remaining - allocated, 2), 0)
+
+    savings = [
+        ['Roth IRA', config['rothIraMonthly'], '=B20/$B$16', 'MAX IT - House + Retirement'],
+        ['Emergency/House Fund', config['emergencyFundMonthly'], '=B21/$B$16',
+         f"Target: ${config['emergencyFundTarget'] / 1000:g}k (faster!)"],
+        ['Brokerage ($50 SPY/$50 QQQ)', config['brokerageMonthly'], '=B22/$B$16', 'Long-term wealth'],
+        ['Fun/Variable Spending', config['funMoneyMonthly'], '=B23/$B$16', 'HARD LIMIT'],
+        ['Buffer (Unexpected)', buffer, '=B24/$B$16', 'Peace of mind'],
+    ]
+
+    for r, (cat, amt, pct, purpose) in enumerate(savings, 20):
+        ws2.cell(row=r, column=1, value=cat).border = thin_border
+        cell = ws2.cell(row=r, column=2, value=amt)
+        style_cell(cell, is_money=True)
+        cell = ws2.cell(row=r, column=3, value=pct)
+        style_cell(cell, is_percent=True)
+        ws2.cell(row=r, column=4, value=purpose).border = thin_border
+
+    ws2['A25'] = "TOTAL ALLOCATED"
+    ws2['A25'].font = Font(bold=True)
+    ws2['B25'] = '=SUM(B20:B24)'
+    style_cell(ws2['B25'], is_money=True)
+    ws2['B25'].font = Font(bold=True)
+
+    # Balance Check
+    ws2['A27'] = "BALANCE CHECK"
+    ws2['A27'].font = Font(bold=True, size=12)
+    ws2['B27'] = '=B16-B25'
+    style_cell(ws2['B27'], is_money=True)
+    ws2['C27'] = '← Should be $0 or close to it'
+
+    ws2.column_dimensions['A'].width = 35
+    ws2.column_dimensions['B'].width = 15
+    ws2.column_dimensions['C'].width = 18
+    ws2.column_dimensions['D'].width = 25
 
 # ============================================
-# SHEET 2: MONTHLY BUDGET
+# SHEET 3: ROTH IRA TRACKER
 # ============================================
-ws2 = wb.create_sheet("Monthly Budget")
-
-ws2['A1'] = "MONTHLY BUDGET PLANNER"
-ws2['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws2.merge_cells('A1:E1')
-
-# Income Section
-ws2['A3'] = "MONTHLY INCOME"
-ws2['A3'].font = Font(bold=True, size=12)
-style_header(ws2['A3'])
-ws2.merge_cells('A3:C3')
-
-ws2['A4'] = "Net Monthly Income (avg)"
-ws2['B4'] = 4160
-ws2['C4'] = "Based on $1,920 x 26 / 12"
-style_cell(ws2['B4'], is_money=True)
-
-# Fixed Expenses
-ws2['A6'] = "FIXED EXPENSES (Non-Negotiable)"
-ws2['A6'].font = Font(bold=True, size=12)
-style_header(ws2['A6'])
-ws2.merge_cells('A6:C6')
-
-fixed_expenses = [
-    ['Rent', 1815, 'Fixed'],
-    ['Power', 120, 'Estimate'],
-    ['Internet', 51.16, 'Fixed'],
-    ['Gas (Utilities)', 50, 'Estimate'],
-    ['Groceries', 145, 'Budget'],
-    ['Credit Card Payment', 230, '4 months remaining'],
-]
+def build_roth_ira_tracker(ws3, state, derived):
+    config = state['config']
+    annual_limit = config['rothIraAnnualLimit']
+
+    ws3['A1'] = "🎯 ROTH IRA TRACKER - MAX THAT ROTH!"
+    ws3['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws3.merge_cells('A1:E1')
+
+    # Why Max Roth IRA
+    ws3['A3'] = "WHY MAXING ROTH IRA IS IMPORTANT:"
+    ws3['A3'].font = Font(bold=True, size=12)
+    ws3.merge_cells('A3:E3')
+
+    reasons = [
+        "✓ Tax-FREE growth forever - never pay taxes on gains",
+        "✓ First $10k can go toward house (first-time homebuyer exception)",
+        "✓ Can withdraw CONTRIBUTIONS anytime tax/penalty free",
+        f"✓ ${annual_limit:,.0f}/year limit - USE IT OR LOSE IT (can't make up later)",
+        "✓ At your age, compound growth is your superpower",
+    ]
+    for r, reason in enumerate(reasons, 4):
+        ws3.cell(row=r, column=1, value=reason)
+        ws3.merge_cells(f'A{r}:E{r}')
+
+    # 2025 Progress
+    ws3['A10'] = "2025 CONTRIBUTION PROGRESS"
+    ws3['A10'].font = Font(bold=True, size=14)
+    ws3.merge_cells('A10:E10')
+
+    for i, h in enumerate(['Month', 'Contribution', 'YTD Total', 'Remaining', '% Complete'], 1):
+        cell = ws3.cell(row=11, column=i, value=h)
+        style_header(cell)
+
+    months = ['January', 'February', 'March', 'April', 'May', 'June',
+              'July', 'August', 'September', 'October', 'November', 'December']
+
+    contributions = {month: 0 for month in months}
+    for c in state['rothIraContributions']:
+        if c.get('month') in contributions:
+            contributions[c['month']] += c['amount']
+
+    for r, month in enumerate(months, 12):
+        ws3.cell(row=r, column=1, value=month).border = thin_border
+
+        # Contribution (enter manually)
+        cell = ws3.cell(row=r, column=2, value=round(contributions[month], 2))
+        style_cell(cell, is_money=True)
 
-for i, h in enumerate(['Expense', 'Amount', 'Notes'], 1):
-    cell = ws2.cell(row=7, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
+        # YTD Total
+        if r == 12:
+            formula = '=B12'
+        else:
+            formula = f'=C{r-1}+B{r}'
+        cell = ws3.cell(row=r, column=3, value=formula)
+        style_cell(cell, is_money=True)
 
-for r, (exp, amt, note) in enumerate(fixed_expenses, 8):
-    ws2.cell(row=r, column=1, value=exp).border = thin_border
-    cell = ws2.cell(row=r, column=2, value=amt)
-    style_cell(cell, is_money=True)
-    ws2.cell(row=r, column=3, value=note).border = thin_border
-
-ws2['A14'] = "TOTAL FIXED"
-ws2['A14'].font = Font(bold=True)
-ws2['B14'] = '=SUM(B8:B13)'
-style_cell(ws2['B14'], is_money=True)
-ws2['B14'].font = Font(bold=True)
-
-# After Fixed
-ws2['A16'] = "REMAINING AFTER FIXED"
-ws2['A16'].font = Font(bold=True, size=12, color="228B22")
-ws2['B16'] = '=B4-B14'
-style_cell(ws2['B16'], is_money=True)
-ws2['B16'].font = Font(bold=True, size=12)
-ws2['B16'].fill = green_fill
-
-# Savings Allocation (from remaining)
-ws2['A18'] = "SAVINGS ALLOCATION (From Remaining)"
-ws2['A18'].font = Font(bold=True, size=12)
-style_header(ws2['A18'])
-ws2.merge_cells('A18:D18')
-
-for i, h in enumerate(['Category', 'Monthly', '% of Remaining', 'Purpose'], 1):
-    cell = ws2.cell(row=19, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
+        # Remaining
+        cell = ws3.cell(row=r, column=4, value=f'={annual_limit:g}-C{r}')
+        style_cell(cell, is_money=True)
 
-savings = [
-    ['Roth IRA', 583.33, '=B20/$B$16', 'MAX IT - House + Retirement'],
-    ['Emergency/House Fund', 850, '=B21/$B$16', 'Target: $15k (faster!)'],
-    ['Brokerage ($50 SPY/$50 QQQ)', 100, '=B22/$B$16', 'Long-term wealth'],
-    ['Fun/Variable Spending', 150, '=B23/$B$16', 'HARD LIMIT'],
-    ['Buffer (Unexpected)', 65.51, '=B24/$B$16', 'Peace of mind'],
-]
+        # % Complete
+        cell = ws3.cell(row=r, column=5, value=f'=C{r}/{annual_limit:g}')
+        style_cell(cell, is_percent=True)
 
-for r, (cat, amt, pct, purpose) in enumerate(savings, 20):
-    ws2.cell(row=r, column=1, value=cat).border = thin_border
-    cell = ws2.cell(row=r, column=2, value=amt)
-    style_cell(cell, is_money=True)
-    cell = ws2.cell(row=r, column=3, value=pct)
-    style_cell(cell, is_percent=True)
-    ws2.cell(row=r, column=4, value=purpose).border = thin_border
-
-ws2['A25'] = "TOTAL ALLOCATED"
-ws2['A25'].font = Font(bold=True)
-ws2['B25'] = '=SUM(B20:B24)'
-style_cell(ws2['B25'], is_money=True)
-ws2['B25'].font = Font(bold=True)
-
-# Balance Check
-ws2['A27'] = "BALANCE CHECK"
-ws2['A27'].font = Font(bold=True, size=12)
-ws2['B27'] = '=B16-B25'
-style_cell(ws2['B27'], is_money=True)
-ws2['C27'] = '← Should be $0 or close to it'
-
-ws2.column_dimensions['A'].width = 35
-ws2.column_dimensions['B'].width = 15
-ws2.column_dimensions['C'].width = 18
-ws2.column_dimensions['D'].width = 25
+    # Summary
+    ws3['A25'] = "Target Monthly Contribution:"
+    ws3['B25'] = config['rothIraMonthly']
+    style_cell(ws3['B25'], is_money=True)
+    ws3['C25'] = f"= ${annual_limit:,.0f} / 12 months"
 
-# ============================================
-# SHEET 3: ROTH IRA TRACKER
-# ============================================
-ws3 = wb.create_sheet("Roth IRA Tracker")
-
-ws3['A1'] = "🎯 ROTH IRA TRACKER - MAX THAT ROTH!"
-ws3['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws3.merge_cells('A1:E1')
-
-# Why Max Roth IRA
-ws3['A3'] = "WHY MAXING ROTH IRA IS IMPORTANT:"
-ws3['A3'].font = Font(bold=True, size=12)
-ws3.merge_cells('A3:E3')
-
-reasons = [
-    "✓ Tax-FREE growth forever - never pay taxes on gains",
-    "✓ First $10k can go toward house (first-time homebuyer exception)",
-    "✓ Can withdraw CONTRIBUTIONS anytime tax/penalty free",
-    "✓ $7,000/year limit - USE IT OR LOSE IT (can't make up later)",
-    "✓ At your age, compound growth is your superpower",
-]
-for r, reason in enumerate(reasons, 4):
-    ws3.cell(row=r, column=1, value=reason)
-    ws3.merge_cells(f'A{r}:E{r}')
-
-# 2025 Progress
-ws3['A10'] = "2025 CONTRIBUTION PROGRESS"
-ws3['A10'].font = Font(bold=True, size=14)
-ws3.merge_cells('A10:E10')
-
-for i, h in enumerate(['Month', 'Contribution', 'YTD Total', 'Remaining', '% Complete'], 1):
-    cell = ws3.cell(row=11, column=i, value=h)
-    style_header(cell)
-
-months = ['January', 'February', 'March', 'April', 'May', 'June',
-          'July', 'August', 'September', 'October', 'November', 'December']
-
-for r, month in enumerate(months, 12):
-    ws3.cell(row=r, column=1, value=month).border = thin_border
-
-    # Contribution (enter manually)
-    cell = ws3.cell(row=r, column=2, value=583.33 if month == 'January' else 0)
-    style_cell(cell, is_money=True)
-
-    # YTD Total
-    if r == 12:
-        formula = '=B12'
-    else:
-        formula = f'=C{r-1}+B{r}'
-    cell = ws3.cell(row=r, column=3, value=formula)
-    style_cell(cell, is_money=True)
-
-    # Remaining
-    cell = ws3.cell(row=r, column=4, value=f'=7000-C{r}')
-    style_cell(cell, is_money=True)
-
-    # % Complete
-    cell = ws3.cell(row=r, column=5, value=f'=C{r}/7000')
-    style_cell(cell, is_percent=True)
-
-# Summary
-ws3['A25'] = "Target Monthly Contribution:"
-ws3['B25'] = 583.33
-style_cell(ws3['B25'], is_money=True)
-ws3['C25'] = "= $7,000 / 12 months"
-
-ws3['A26'] = "Annual Limit (2025):"
-ws3['B26'] = 7000
-style_cell(ws3['B26'], is_money=True)
-
-ws3['A27'] = "Your Total Contributed:"
-ws3['B27'] = '=C23'
-style_cell(ws3['B27'], is_money=True)
-ws3['B27'].font = Font(bold=True)
-
-ws3.column_dimensions['A'].width = 25
-ws3.column_dimensions['B'].width = 15
-ws3.column_dimensions['C'].width = 15
-ws3.column_dimensions['D'].width = 15
-ws3.column_dimensions['E'].width = 15
+    ws3['A26'] = "Annual Limit (2025):"
+    ws3['B26'] = annual_limit
+    style_cell(ws3['B26'], is_money=True)
+
+    ws3['A27'] = "Your Total Contributed:"
+    ws3['B27'] = '=C23'
+    style_cell(ws3['B27'], is_money=True)
+    ws3['B27'].font = Font(bold=True)
+
+    ws3.column_dimensions['A'].width = 25
+    ws3.column_dimensions['B'].width = 15
+    ws3.column_dimensions['C'].width = 15
+    ws3.column_dimensions['D'].width = 15
+    ws3.column_dimensions['E'].width = 15
 
 # ============================================
 # SHEET 4: CREDIT CARD PAYOFF
 # ============================================
-ws4 = wb.create_sheet("Credit Card Payoff")
-
-ws4['A1'] = "💳 CREDIT CARD DEBT PAYOFF TRACKER"
-ws4['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws4.merge_cells('A1:E1')
-
-# Debt Summary
-ws4['A3'] = "DEBT SUMMARY"
-ws4['A3'].font = Font(bold=True, size=12)
-style_header(ws4['A3'])
-ws4.merge_cells('A3:C3')
-
-ws4['A4'] = "Total Debt (Enter Here):"
-ws4['B4'] = 920  # $230 x 4 months
-style_cell(ws4['B4'], is_money=True)
-ws4['B4'].fill = yellow_fill
-
-ws4['A5'] = "Monthly Payment:"
-ws4['B5'] = 230
-style_cell(ws4['B5'], is_money=True)
-
-ws4['A6'] = "Months to Payoff:"
-ws4['B6'] = '=CEILING(B4/B5,1)'
-style_cell(ws4['B6'])
-
-ws4['A7'] = "Target Payoff Date:"
-ws4['B7'] = '=TODAY()+B6*30'
-ws4['B7'].number_format = 'MMM YYYY'
-
-# Payment Schedule
-ws4['A9'] = "PAYMENT SCHEDULE"
-ws4['A9'].font = Font(bold=True, size=12)
-style_header(ws4['A9'])
-ws4.merge_cells('A9:E9')
-
-for i, h in enumerate(['Month', 'Payment', 'Remaining Balance', 'Paid?', 'Date Paid'], 1):
-    cell = ws4.cell(row=10, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
+def build_credit_card_payoff(ws4, state, derived):
+    credit_card = state['creditCard']
+
+    ws4['A1'] = "💳 CREDIT CARD DEBT PAYOFF TRACKER"
+    ws4['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws4.merge_cells('A1:E1')
+
+    # Debt Summary
+    ws4['A3'] = "DEBT SUMMARY"
+    ws4['A3'].font = Font(bold=True, size=12)
+    style_header(ws4['A3'])
+    ws4.merge_cells('A3:C3')
+
+    ws4['A4'] = "Total Debt (Enter Here):"
+    ws4['B4'] = credit_card['totalAmount']
+    style_cell(ws4['B4'], is_money=True)
+    ws4['B4'].fill = yellow_fill
+
+    ws4['A5'] = "Monthly Payment:"
+    ws4['B5'] = credit_card['monthlyPayment']
+    style_cell(ws4['B5'], is_money=True)
+
+    ws4['A6'] = "Months to Payoff:"
+    ws4['B6'] = '=CEILING(B4/B5,1)'
+    style_cell(ws4['B6'])
+
+    ws4['A7'] = "Target Payoff Date:"
+    ws4['B7'] = '=TODAY()+B6*30'
+    ws4['B7'].number_format = 'MMM YYYY'
+
+    # Payment Schedule
+    ws4['A9'] = "PAYMENT SCHEDULE"
+    ws4['A9'].font = Font(bold=True, size=12)
+    style_header(ws4['A9'])
+    ws4.merge_cells('A9:E9')
+
+    for i, h in enumerate(['Month', 'Payment', 'Remaining Balance', 'Paid?', 'Date Paid'], 1):
+        cell = ws4.cell(row=10, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-for r in range(11, 15):  # 4 months
-    ws4.cell(row=r, column=1, value=f'Month {r-10}').border = thin_border
-    cell = ws4.cell(row=r, column=2, value=230)
-    style_cell(cell, is_money=True)
-
-    if r == 11:
-        formula = f'=$B$4-B{r}'
-    else:
-        formula = f'=C{r-1}-B{r}'
-    cell = ws4.cell(row=r, column=3, value=formula)
-    style_cell(cell, is_money=True)
-
-    ws4.cell(row=r, column=4, value='☐').border = thin_border  # Checkbox placeholder
-    ws4.cell(row=r, column=5, value='').border = thin_border
-
-# After Payoff
-ws4['A16'] = "🎉 AFTER PAYOFF - REDIRECT $230/MONTH TO:"
-ws4['A16'].font = Font(bold=True, size=12, color="228B22")
-ws4.merge_cells('A16:E16')
-
-redirect_options = [
-    ['Emergency Fund', 'Reach $15k faster'],
-    ['Brokerage', 'More investing power'],
-    ['Fun Money', 'Reward yourself!'],
-]
-for r, (option, note) in enumerate(redirect_options, 17):
-    ws4.cell(row=r, column=1, value=f'• {option}')
-    ws4.cell(row=r, column=2, value=note).font = Font(italic=True, color="666666")
+    last_row = 10
+    for r, payment in enumerate(credit_card['payments'], 11):
+        ws4.cell(row=r, column=1, value=f"Month {payment['month']}").border = thin_border
+        cell = ws4.cell(row=r, column=2, value=payment['amount'])
+        style_cell(cell, is_money=True)
 
-ws4.column_dimensions['A'].width = 35
-ws4.column_dimensions['B'].width = 15
-ws4.column_dimensions['C'].width = 20
-ws4.column_dimensions['D'].width = 10
-ws4.column_dimensions['E'].width = 15
+        if r == 11:
+            formula = f'=$B$4-B{r}'
+        else:
+            formula = f'=C{r-1}-B{r}'
+        cell = ws4.cell(row=r, column=3, value=formula)
+        style_cell(cell, is_money=True)
+
+        ws4.cell(row=r, column=4, value='☑' if payment.get('paid') else '☐').border = thin_border
+        ws4.cell(row=r, column=5, value=payment.get('datePaid', '')).border = thin_border
+        last_row = r
+
+    # After Payoff
+    after_row = last_row + 2
+    ws4[f'A{after_row}'] = f"🎉 AFTER PAYOFF - REDIRECT ${credit_card['monthlyPayment']:,.0f}/MONTH TO:"
+    ws4[f'A{after_row}'].font = Font(bold=True, size=12, color="228B22")
+    ws4.merge_cells(f'A{after_row}:E{after_row}')
+
+    redirect_options = [
+        ['Emergency Fund', 'Reach $15k faster'],
+        ['Brokerage', 'More investing power'],
+        ['Fun Money', 'Reward yourself!'],
+    ]
+    for r, (option, note) in enumerate(redirect_options, after_row + 1):
+        ws4.cell(row=r, column=1, value=f'• {option}')
+        ws4.cell(row=r, column=2, value=note).font = Font(italic=True, color="666666")
+
+    ws4.column_dimensions['A'].width = 35
+    ws4.column_dimensions['B'].width = 15
+    ws4.column_dimensions['C'].width = 20
+    ws4.column_dimensions['D'].width = 10
+    ws4.column_dimensions['E'].width = 15
 
 # ============================================
 # SHEET 5: WORK EXPENSE FLOAT TRACKER
 # ============================================
-ws5 = wb.create_sheet("Work Expenses")
-
-ws5['A1'] = "🏢 WORK EXPENSE FLOAT TRACKER"
-ws5['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws5.merge_cells('A1:G1')
-
-ws5['A3'] = "Track expenses you pay out-of-pocket for work reimbursement"
-ws5['A3'].font = Font(italic=True, color="666666")
-ws5.merge_cells('A3:G3')
-
-# Summary
-ws5['A5'] = "CURRENT FLOAT SUMMARY"
-ws5['A5'].font = Font(bold=True, size=12)
-style_header(ws5['A5'])
-ws5.merge_cells('A5:C5')
-
-ws5['A6'] = "Total Outstanding:"
-ws5['B6'] = '=SUMIF(F10:F100,"Pending",D10:D100)'
-style_cell(ws5['B6'], is_money=True)
-ws5['B6'].fill = yellow_fill
-
-ws5['A7'] = "Expected Reimbursement Date:"
-ws5['B7'] = '=MIN(G10:G100)'
-ws5['B7'].number_format = 'MM/DD/YYYY'
-
-# Expense Log
-for i, h in enumerate(['Date', 'Description', 'Category', 'Amount', 'Receipt?', 'Status', 'Expected Reimb.'], 1):
-    cell = ws5.cell(row=9, column=i, value=h)
-    style_header(cell)
-
-# Sample entries
-sample_expenses = [
-    ['01/15/2025', 'Client lunch - Project X', 'Meals', 45.00, 'Yes', 'Pending', '02/01/2025'],
-    ['01/18/2025', 'Uber to client site', 'Travel', 28.50, 'Yes', 'Pending', '02/01/2025'],
-    ['', '', '', '', '', '', ''],  # Empty rows for future entries
-    ['', '', '', '', '', '', ''],
-    ['', '', '', '', '', '', ''],
-]
-
-for r, expense in enumerate(sample_expenses, 10):
-    for c, val in enumerate(expense, 1):
-        cell = ws5.cell(row=r, column=c, value=val)
-        cell.border = thin_border
-        if c == 4 and val:  # Amount column
-            cell.number_format = money_format
-
-# Float Impact Analysis
-ws5['A17'] = "FLOAT IMPACT ON BUDGET"
-ws5['A17'].font = Font(bold=True, size=12)
-style_header(ws5['A17'])
-ws5.merge_cells('A17:C17')
-
-ws5['A18'] = "Max Safe Float (1 paycheck):"
-ws5['B18'] = 1920
-style_cell(ws5['B18'], is_money=True)
-
-ws5['A19'] = "Current Float:"
-ws5['B19'] = '=B6'
-style_cell(ws5['B19'], is_money=True)
-
-ws5['A20'] = "Remaining Float Capacity:"
-ws5['B20'] = '=B18-B19'
-style_cell(ws5['B20'], is_money=True)
-
-ws5['A22'] = "⚠️ If float > 1 paycheck, delay non-essential spending until reimbursed"
-ws5['A22'].font = Font(italic=True, color="CC0000")
-ws5.merge_cells('A22:G22')
-
-ws5.column_dimensions['A'].width = 15
-ws5.column_dimensions['B'].width = 25
-ws5.column_dimensions['C'].width = 12
-ws5.column_dimensions['D'].width = 12
-ws5.column_dimensions['E'].width = 10
-ws5.column_dimensions['F'].width = 12
-ws5.column_dimensions['G'].width = 18
+def build_work_expenses(ws5, state, derived):
+    expenses = [
+        [e['date'], e['description'], e['category'], e['amount'],
+         'Yes' if e.get('hasReceipt') else 'No', e['status'], e.get('expectedReimbursementDate', '')]
+        for e in state['workExpenses']
+    ]
+    expenses += [['', '', '', '', '', '', '']] * 3  # Empty rows for future entries
+    log_end = max(100, 9 + len(expenses))
+
+    ws5['A1'] = "🏢 WORK EXPENSE FLOAT TRACKER"
+    ws5['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws5.merge_cells('A1:G1')
+
+    ws5['A3'] = "Track expenses you pay out-of-pocket for work reimbursement"
+    ws5['A3'].font = Font(italic=True, color="666666")
+    ws5.merge_cells('A3:G3')
+
+    # Summary
+    ws5['A5'] = "CURRENT FLOAT SUMMARY"
+    ws5['A5'].font = Font(bold=True, size=12)
+    style_header(ws5['A5'])
+    ws5.merge_cells('A5:C5')
+
+    ws5['A6'] = "Total Outstanding:"
+    ws5['B6'] = f'=SUMIF(F10:F{log_end},"Pending",D10:D{log_end})'
+    style_cell(ws5['B6'], is_money=True)
+    ws5['B6'].fill = yellow_fill
+
+    ws5['A7'] = "Expected Reimbursement Date:"
+    ws5['B7'] = f'=MIN(G10:G{log_end})'
+    ws5['B7'].number_format = 'MM/DD/YYYY'
+
+    # Expense Log
+    for i, h in enumerate(['Date', 'Description', 'Category', 'Amount', 'Receipt?', 'Status', 'Expected Reimb.'], 1):
+        cell = ws5.cell(row=9, column=i, value=h)
+        style_header(cell)
+
+    for r, expense in enumerate(expenses, 10):
+        for c, val in enumerate(expense, 1):
+            cell = ws5.cell(row=r, column=c, value=val)
+            cell.border = thin_border
+            if c == 4 and val:  # Amount column
+                cell.number_format = money_format
+
+    # Float Impact Analysis
+    f = 10 + len(expenses) + 2
+    ws5[f'A{f}'] = "FLOAT IMPACT ON BUDGET"
+    ws5[f'A{f}'].font = Font(bold=True, size=12)
+    style_header(ws5[f'A{f}'])
+    ws5.merge_cells(f'A{f}:C{f}')
+
+    ws5[f'A{f+1}'] = "Max Safe Float (1 paycheck):"
+    ws5[f'B{f+1}'] = state['config']['netPayPerPaycheck']
+    style_cell(ws5[f'B{f+1}'], is_money=True)
+
+    ws5[f'A{f+2}'] = "Current Float:"
+    ws5[f'B{f+2}'] = '=B6'
+    style_cell(ws5[f'B{f+2}'], is_money=True)
+
+    ws5[f'A{f+3}'] = "Remaining Float Capacity:"
+    ws5[f'B{f+3}'] = f'=B{f+1}-B{f+2}'
+    style_cell(ws5[f'B{f+3}'], is_money=True)
+
+    ws5[f'A{f+5}'] = "⚠️ If float > 1 paycheck, delay non-essential spending until reimbursed"
+    ws5[f'A{f+5}'].font = Font(italic=True, color="CC0000")
+    ws5.merge_cells(f'A{f+5}:G{f+5}')
+
+    ws5.column_dimensions['A'].width = 15
+    ws5.column_dimensions['B'].width = 25
+    ws5.column_dimensions['C'].width = 12
+    ws5.column_dimensions['D'].width = 12
+    ws5.column_dimensions['E'].width = 10
+    ws5.column_dimensions['F'].width = 12
+    ws5.column_dimensions['G'].width = 18
 
 # ============================================
 # SHEET 6: EMERGENCY FUND TRACKER
 # ============================================
-ws6 = wb.create_sheet("Emergency Fund")
-
-ws6['A1'] = "🏦 EMERGENCY FUND TRACKER"
-ws6['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws6.merge_cells('A1:E1')
-
-ws6['A3'] = "Goal: $15,000 (About 6 months of essential expenses)"
-ws6['A3'].font = Font(bold=True, size=12)
+def build_emergency_fund(ws6, state, derived):
+    config = state['config']
+    entries = state['emergencyFundEntries']
+
+    ws6['A1'] = "🏦 EMERGENCY FUND TRACKER"
+    ws6['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws6.merge_cells('A1:E1')
+
+    ws6['A3'] = f"Goal: ${config['emergencyFundTarget']:,.0f} (About 6 months of essential expenses)"
+    ws6['A3'].font = Font(bold=True, size=12)
+
+    # Current Status
+    ws6['A5'] = "CURRENT STATUS"
+    style_header(ws6['A5'])
+    ws6.merge_cells('A5:C5')
+
+    ws6['A6'] = "Current Balance:"
+    ws6['B6'] = state['emergencyFundBalance']
+    style_cell(ws6['B6'], is_money=True)
+    ws6['B6'].fill = yellow_fill
+
+    ws6['A7'] = "Target:"
+    ws6['B7'] = config['emergencyFundTarget']
+    style_cell(ws6['B7'], is_money=True)
+
+    ws6['A8'] = "Remaining to Goal:"
+    ws6['B8'] = '=B7-B6'
+    style_cell(ws6['B8'], is_money=True)
+
+    ws6['A9'] = "Progress:"
+    ws6['B9'] = '=B6/B7'
+    style_cell(ws6['B9'], is_percent=True)
+
+    ws6['A11'] = "Monthly Contribution:"
+    ws6['B11'] = config['emergencyFundMonthly']
+    style_cell(ws6['B11'], is_money=True)
+
+    ws6['A12'] = "Months to Goal:"
+    ws6['B12'] = '=CEILING(B8/B11,1)'
+
+    ws6['A13'] = "Target Date:"
+    ws6['B13'] = '=TODAY()+B12*30'
+    ws6['B13'].number_format = 'MMM YYYY'
+
+    # Monthly Progress
+    ws6['A15'] = "MONTHLY CONTRIBUTIONS"
+    style_header(ws6['A15'])
+    ws6.merge_cells('A15:D15')
+
+    for i, h in enumerate(['Month', 'Contribution', 'Running Total', '% to Goal'], 1):
+        cell = ws6.cell(row=16, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-# Current Status
-ws6['A5'] = "CURRENT STATUS"
-style_header(ws6['A5'])
-ws6.merge_cells('A5:C5')
+    for r in range(17, 17 + max(20, len(entries))):  # at least 20 months of tracking
+        entry = entries[r - 17] if r - 17 < len(entries) else {'month': '', 'amount': 0}
+        ws6.cell(row=r, column=1, value=entry['month']).border = thin_border
+        cell = ws6.cell(row=r, column=2, value=entry['amount'])
+        style_cell(cell, is_money=True)
 
-ws6['A6'] = "Current Balance:"
-ws6['B6'] = 0  # Enter current balance
-style_cell(ws6['B6'], is_money=True)
-ws6['B6'].fill = yellow_fill
+        if r == 17:
+            formula = f'=$B$6+B{r}'
+        else:
+            formula = f'=C{r-1}+B{r}'
+        cell = ws6.cell(row=r, column=3, value=formula)
+        style_cell(cell, is_money=True)
 
-ws6['A7'] = "Target:"
-ws6['B7'] = 15000
-style_cell(ws6['B7'], is_money=True)
+        cell = ws6.cell(row=r, column=4, value=f'=C{r}/$B$7')
+        style_cell(cell, is_percent=True)
 
-ws6['A8'] = "Remaining to Goal:"
-ws6['B8'] = '=B7-B6'
-style_cell(ws6['B8'], is_money=True)
+    ws6.column_dimensions['A'].width = 20
+    ws6.column_dimensions['B'].width = 15
+    ws6.column_dimensions['C'].width = 15
+    ws6.column_dimensions['D'].width = 12
 
-ws6['A9'] = "Progress:"
-ws6['B9'] = '=B6/B7'
-style_cell(ws6['B9'], is_percent=True)
+# ============================================
+# SHEET 7: PAYCHECK TRACKER
+# ============================================
+def build_paycheck_tracker(ws7, state, derived):
+    config = state['config']
+    paychecks = state['paychecks']
+
+    ws7['A1'] = "📅 PAYCHECK-BY-PAYCHECK TRACKER"
+    ws7['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws7.merge_cells('A1:H1')
+
+    ws7['A3'] = "Track each paycheck and how you allocate it"
+    ws7['A3'].font = Font(italic=True, color="666666")
+
+    # Standard allocation per paycheck
+    ws7['A5'] = f"STANDARD PAYCHECK ALLOCATION (~${config['netPayPerPaycheck']:,.0f} net)"
+    style_header(ws7['A5'])
+    ws7.merge_cells('A5:C5')
+
+    fixed_keys = ['rent', 'power', 'internet', 'gas', 'groceries']
+    allocations = [
+        ['Fixed Expenses (half monthly)', round(sum(config[k] for k in fixed_keys) / 2, 2),
+         '(' + ' + '.join(f'${config[k]:g}' for k in fixed_keys) + ') / 2'],
+        ['Roth IRA', round(config['rothIraMonthly'] / 2, 2), f"${config['rothIraMonthly']:g}/2 per paycheck"],
+        ['Emergency Fund', round(config['emergencyFundMonthly'] / 2, 2), f"${config['emergencyFundMonthly']:g}/2 per paycheck"],
+        ['Brokerage', round(config['brokerageMonthly'] / 2, 2), f"${config['brokerageMonthly']:g}/2 per paycheck"],
+        ['Fun Money', round(config['funMoneyMonthly'] / 2, 2), f"${config['funMoneyMonthly']:g}/2 per paycheck - HARD LIMIT"],
+        ['Buffer/CC if applicable', 0, 'Adjust as needed'],
+    ]
+
+    for i, h in enumerate(['Category', 'Amount', 'Notes'], 1):
+        cell = ws7.cell(row=6, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-ws6['A11'] = "Monthly Contribution:"
-ws6['B11'] = 750
-style_cell(ws6['B11'], is_money=True)
+    for r, (cat, amt, note) in enumerate(allocations, 7):
+        ws7.cell(row=r, column=1, value=cat).border = thin_border
+        cell = ws7.cell(row=r, column=2, value=amt)
+        style_cell(cell, is_money=True)
+        ws7.cell(row=r, column=3, value=note).border = thin_border
+
+    ws7['A13'] = "TOTAL:"
+    ws7['B13'] = '=SUM(B7:B12)'
+    style_cell(ws7['B13'], is_money=True)
+    ws7['B13'].font = Font(bold=True)
+
+    # Actual paycheck log
+    ws7['A15'] = "ACTUAL PAYCHECK LOG"
+    style_header(ws7['A15'])
+    ws7.merge_cells('A15:H15')
+
+    headers = ['Pay Date', 'Gross', 'Net', 'Hours', 'Roth IRA', 'E-Fund', 'Brokerage', 'Notes']
+    for i, h in enumerate(headers, 1):
+        cell = ws7.cell(row=16, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-ws6['A12'] = "Months to Goal:"
-ws6['B12'] = '=CEILING(B8/B11,1)'
+    fields = ['payDate', 'gross', 'net', 'hours', 'rothIra', 'emergencyFund', 'brokerage', 'notes']
+    for r, paycheck in enumerate(paychecks, 17):
+        for c, field in enumerate(fields, 1):
+            cell = ws7.cell(row=r, column=c, value=paycheck.get(field, ''))
+            cell.border = thin_border
+            if c in [2, 3, 5, 6, 7]:
+                cell.number_format = money_format
+
+    # Empty rows for future entries
+    for r in range(17 + len(paychecks), max(30, 18 + len(paychecks))):
+        for c in range(1, 9):
+            ws7.cell(row=r, column=c, value='').border = thin_border
+
+    ws7.column_dimensions['A'].width = 12
+    ws7.column_dimensions['B'].width = 12
+    ws7.column_dimensions['C'].width = 12
+    ws7.column_dimensions['D'].width = 8
+    ws7.column_dimensions['E'].width = 12
+    ws7.column_dimensions['F'].width = 12
+    ws7.column_dimensions['G'].width = 12
+    ws7.column_dimensions['H'].width = 20
 
-ws6['A13'] = "Target Date:"
-ws6['B13'] = '=TODAY()+B12*30'
-ws6['B13'].number_format = 'MMM YYYY'
+# ============================================
+# SHEET 8: THE MONEY RULES
+# ============================================
+def build_money_rules(ws8, state, derived):
+    config = state['config']
+    credit_card = state['creditCard']
+    payments_left = sum(1 for p in credit_card['payments'] if not p.get('paid'))
+    match_percent = config['employerMatchPercent']
+    employer_match = config['annualSalary'] * match_percent / 100
+
+    ws8['A1'] = "📚 JOSHUA'S MONEY MANAGEMENT RULES"
+    ws8['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws8.merge_cells('A1:E1')
+
+    rules = [
+        "",
+        "🎯 THE PRIORITY ORDER (Pay Yourself First)",
+        "────────────────────────────────────",
+        "1. Fixed expenses MUST be covered (rent, utilities, food)",
+        f"2. Credit card debt gets eliminated ({payments_left} months then done!)",
+        f"3. Roth IRA gets maxed (${config['rothIraMonthly']:g}/month - tax-free forever)",
+        f"4. Emergency fund grows (${config['emergencyFundMonthly']:g}/month until ${config['emergencyFundTarget'] / 1000:g}k)",
+        "5. Brokerage for extra wealth building",
+        "6. Fun money LAST (but don't skip it - burnout is real)",
+        "",
+        "💡 KEY INSIGHTS FROM YOUR NUMBERS",
+        "────────────────────────────────────",
+        f"• Your employer gives you FREE {match_percent:g}% 401k match = ~${employer_match:,.0f}/year FREE MONEY",
+        "• You're already saving 8% in Roth 401k + HSA from paycheck",
+        "• Total retirement savings: ~24% of gross (excellent!)",
+        f"• After CC payoff, you'll have ${credit_card['monthlyPayment']:g} extra/month",
+        "",
+        "⚠️ WARNING SIGNS TO WATCH",
+        "────────────────────────────────────",
+        "• Fun spending hitting $308? That's eating into savings",
+        "• Work expense float > 1 paycheck? Delay discretionary spending",
+        "• Skipping Roth IRA contribution? You lose that year's limit forever",
+        "",
+        "🏆 YOUR FINANCIAL SUPERPOWERS",
+        "────────────────────────────────────",
+        "• Young + high savings rate = compound interest machine",
+        "• HSA = triple tax advantage (pre-tax in, grows tax-free, tax-free out for medical)",
+        "• Roth IRA = flexibility (contributions out anytime, $10k for house)",
+        "• Employer match = instant 100% return on investment",
+        "",
+        "📊 THE MATH THAT MATTERS",
+        "────────────────────────────────────",
+        "• $583/month in Roth IRA for 30 years @ 7% = ~$700,000",
+        "• That $308 fun spending? Over 30 years @ 7% = ~$370,000 opportunity cost",
+        "• Every $1 saved in your 20s = ~$7.60 at retirement (7% for 30 years)",
+        "",
+        "🎮 GAMIFY YOUR FINANCES",
+        "────────────────────────────────────",
+        "• Set monthly 'high scores' for savings",
+        "• Celebrate milestones (first $1k, $5k, $10k in emergency fund)",
+        "• Track your net worth monthly - watch it grow!",
+    ]
+
+    for r, rule in enumerate(rules, 2):
+        ws8.cell(row=r, column=1, value=rule)
+        ws8.merge_cells(f'A{r}:E{r}')
+        if '🎯' in rule or '💡' in rule or '⚠️' in rule or '🏆' in rule or '📊' in rule or '🎮' in rule:
+            ws8.cell(row=r, column=1).font = Font(bold=True, size=12)
+        if '────' in rule:
+            ws8.cell(row=r, column=1).font = Font(color="AAAAAA")
+
+    ws8.column_dimensions['A'].width = 70
 
-# Monthly Progress
-ws6['A15'] = "MONTHLY CONTRIBUTIONS"
-style_header(ws6['A15'])
-ws6.merge_cells('A15:D15')
+# ============================================
+# SHEET 9: NET WORTH TREND
+# ============================================
+def build_net_worth_trend(ws9, state, derived):
+    today = date.today()
+    current = balances_from_state(state)
+
+    # Month-end balances from the snapshot history (one row per month keeps
+    # the sheet small no matter how long the history gets)
+    points = [(day, balances) for day, balances in derived['history'] if day <= today]
+    monthly = []
+    month_ago = year_ago = {}
+    if points:
+        month_ago = balances_on(points, today - timedelta(days=30))
+        year_ago = balances_on(points, today - timedelta(days=365))
+        year, month = points[0][0].year, points[0][0].month
+        i = 0
+        while (year, month) <= (today.year, today.month):
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            month_end = min(date(next_year, next_month, 1) - timedelta(days=1), today)
+            while i + 1 < len(points) and points[i + 1][0] <= month_end:
+                i += 1
+            monthly.append((month_end, points[i][1]))
+            year, month = next_year, next_month
+
+    accounts = list(current)
+    for _, balances in monthly:
+        accounts += [name for name in balances if name not in accounts]
+    labels = account_labels(state, accounts)
+
+    ws9['A1'] = "📈 NET WORTH TREND"
+    ws9['A1'].font = Font(bold=True, size=16, color="2E75B6")
+    ws9.merge_cells('A1:E1')
+
+    ws9['A3'] = "A snapshot is recorded each time the workbook is built from budget-data.json"
+    ws9['A3'].font = Font(italic=True, color="666666")
+    ws9.merge_cells('A3:E3')
+
+    # Current Status
+    ws9['A5'] = "CURRENT NET WORTH"
+    style_header(ws9['A5'])
+    ws9.merge_cells('A5:C5')
+
+    ws9['A6'] = "Net Worth Today:"
+    ws9['B6'] = round(sum(current.values()), 2)
+    style_cell(ws9['B6'], is_money=True)
+    ws9['B6'].font = Font(bold=True)
+    ws9['B6'].fill = green_fill
+
+    for r, (label, past) in enumerate([("Change (30 days):", month_ago), ("Change (1 year):", year_ago)], 7):
+        ws9.cell(row=r, column=1, value=label)
+        if past:
+            cell = ws9.cell(row=r, column=2, value=round(sum(current.values()) - sum(past.values()), 2))
+            style_cell(cell, is_money=True)
+        else:
+            ws9.cell(row=r, column=2, value="Not enough history yet").font = Font(italic=True, color="666666")
+
+    # Monthly History
+    ws9['A10'] = "MONTHLY HISTORY (Month-End Balances)"
+    style_header(ws9['A10'])
+    ws9.merge_cells(f'A10:{get_column_letter(len(accounts) + 3)}10')
+
+    headers = ['Month'] + [labels.get(name, name) for name in accounts] + ['Net Worth', 'Change']
+    for i, h in enumerate(headers, 1):
+        cell = ws9.cell(row=11, column=i, value=h)
+        cell.fill = subheader_fill
+        cell.font = Font(bold=True)
+        cell.border = thin_border
 
-for i, h in enumerate(['Month', 'Contribution', 'Running Total', '% to Goal'], 1):
-    cell = ws6.cell(row=16, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
+    total_col = get_column_letter(len(accounts) + 2)
+    for r, (month_end, balances) in enumerate(monthly, 12):
+        cell = ws9.cell(row=r, column=1, value=month_end)
+        cell.number_format = 'MMM YYYY'
+        cell.border = thin_border
+        for c, name in enumerate(accounts, 2):
+            cell = ws9.cell(row=r, column=c, value=balances.get(name, 0))
+            style_cell(cell, is_money=True)
 
-for r in range(17, 37):  # 20 months of tracking
-    ws6.cell(row=r, column=1, value='').border = thin_border
-    cell = ws6.cell(row=r, column=2, value=0)
-    style_cell(cell, is_money=True)
+        cell = ws9.cell(row=r, column=len(accounts) + 2, value=f'=SUM(B{r}:{get_column_letter(len(accounts) + 1)}{r})')
+        style_cell(cell, is_money=True)
+        cell.font = Font(bold=True)
 
-    if r == 17:
-        formula = f'=$B$6+B{r}'
-    else:
-        formula = f'=C{r-1}+B{r}'
-    cell = ws6.cell(row=r, column=3, value=formula)
-    style_cell(cell, is_money=True)
+        cell = ws9.cell(row=r, column=len(accounts) + 3, value=0 if r == 12 else f'={total_col}{r}-{total_col}{r-1}')
+        style_cell(cell, is_money=True)
 
-    cell = ws6.cell(row=r, column=4, value=f'=C{r}/$B$7')
-    style_cell(cell, is_percent=True)
+    if not monthly:
+        ws9['A12'] = "No snapshots yet - run with your budget-data.json to start tracking"
+        ws9['A12'].font = Font(italic=True, color="666666")
 
-ws6.column_dimensions['A'].width = 20
-ws6.column_dimensions['B'].width = 15
-ws6.column_dimensions['C'].width = 15
-ws6.column_dimensions['D'].width = 12
+    ws9.column_dimensions['A'].width = 22
+    for c in range(2, len(accounts) + 4):
+        ws9.column_dimensions[get_column_letter(c)].width = 16
 
 # ============================================
-# SHEET 7: PAYCHECK TRACKER
+# SHEET 10: CHART DATA (hidden)
 # ============================================
-ws7 = wb.create_sheet("Paycheck Tracker")
-
-ws7['A1'] = "📅 PAYCHECK-BY-PAYCHECK TRACKER"
-ws7['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws7.merge_cells('A1:H1')
-
-ws7['A3'] = "Track each paycheck and how you allocate it"
-ws7['A3'].font = Font(italic=True, color="666666")
-
-# Standard allocation per paycheck
-ws7['A5'] = "STANDARD PAYCHECK ALLOCATION (~$1,920 net)"
-style_header(ws7['A5'])
-ws7.merge_cells('A5:C5')
-
-allocations = [
-    ['Fixed Expenses (half monthly)', 1110, '=($1815+$120+$51+$50)/2 + $145/2'],
-    ['Roth IRA', 291.67, '$583.33/2 per paycheck'],
-    ['Emergency Fund', 425, '$850/2 per paycheck'],
-    ['Brokerage', 50, '$100/2 per paycheck'],
-    ['Fun Money', 75, '$150/2 per paycheck - HARD LIMIT'],
-    ['Buffer/CC if applicable', 0, 'Adjust as needed'],
-]
-
-for i, h in enumerate(['Category', 'Amount', 'Notes'], 1):
-    cell = ws7.cell(row=6, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
-
-for r, (cat, amt, note) in enumerate(allocations, 7):
-    ws7.cell(row=r, column=1, value=cat).border = thin_border
-    cell = ws7.cell(row=r, column=2, value=amt)
-    style_cell(cell, is_money=True)
-    ws7.cell(row=r, column=3, value=note).border = thin_border
-
-ws7['A13'] = "TOTAL:"
-ws7['B13'] = '=SUM(B7:B12)'
-style_cell(ws7['B13'], is_money=True)
-ws7['B13'].font = Font(bold=True)
-
-# Actual paycheck log
-ws7['A15'] = "ACTUAL PAYCHECK LOG"
-style_header(ws7['A15'])
-ws7.merge_cells('A15:H15')
-
-headers = ['Pay Date', 'Gross', 'Net', 'Hours', 'Roth IRA', 'E-Fund', 'Brokerage', 'Notes']
-for i, h in enumerate(headers, 1):
-    cell = ws7.cell(row=16, column=i, value=h)
-    cell.fill = subheader_fill
-    cell.font = Font(bold=True)
-    cell.border = thin_border
-
-# Sample entry
-sample = ['01/24/2025', 3250.01, 2162.76, 96, 291.67, 375, 50, 'Extra hours']
-for c, val in enumerate(sample, 1):
-    cell = ws7.cell(row=17, column=c, value=val)
-    cell.border = thin_border
-    if c in [2, 3, 5, 6, 7]:
-        cell.number_format = money_format
-
-# Empty rows for future entries
-for r in range(18, 30):
-    for c in range(1, 9):
-        ws7.cell(row=r, column=c, value='').border = thin_border
-
-ws7.column_dimensions['A'].width = 12
-ws7.column_dimensions['B'].width = 12
-ws7.column_dimensions['C'].width = 12
-ws7.column_dimensions['D'].width = 8
-ws7.column_dimensions['E'].width = 12
-ws7.column_dimensions['F'].width = 12
-ws7.column_dimensions['G'].width = 12
-ws7.column_dimensions['H'].width = 20
+def chart_series(state, history):
+    """Pre-aggregated, downsampled series shared by the Dashboard charts and the Chart Data sheet."""
+    config = state['config']
+    spending = spending_by_category(state['budgetTransactions'], state['customCategories'])
+    spending_title = "Spending by Category"
+    if not spending:
+        # Nothing logged yet - show how the monthly budget is split instead
+        spending = [(label, config[key]) for key, label in CATEGORY_LABELS.items()
+                    if config.get(key, 0) > 0]
+        spending_title = "Budgeted Spending by Category"
+
+    today = date.today()
+    net_worth = [(day, sum(b.values())) for day, b in history if day < today]
+    net_worth.append((today, sum(balances_from_state(state).values())))
+    # Snapshots are only stored when something changes, so sample month-ends
+    # to keep the bars evenly spaced in time
+    net_worth = carry_forward(net_worth, month_ends(net_worth[0][0], today, CHART_POINTS))
+
+    return {
+        'spending': spending,
+        'spending_title': spending_title,
+        'net_worth': net_worth,
+        'paychecks': downsample_by_date(paycheck_series(state['paychecks']), CHART_POINTS),
+    }
+
+def build_chart_data(ws10, state, derived):
+    series = derived['charts']
+    ws10.sheet_state = 'hidden'
+
+    blocks = [
+        (1, ['Category', 'Amount'], series['spending']),
+        (4, ['Date', 'Net Worth'], series['net_worth']),
+        (7, ['Pay Date', 'Net Pay'], series['paychecks']),
+    ]
+    for col, headers, rows in blocks:
+        for i, h in enumerate(headers):
+            ws10.cell(row=1, column=col + i, value=h).font = Font(bold=True)
+        for r, (label, amount) in enumerate(rows, 2):
+            cell = ws10.cell(row=r, column=col, value=label)
+            if isinstance(label, date):
+                cell.number_format = 'MM/DD/YYYY'
+            ws10.cell(row=r, column=col + 1, value=round(amount, 2)).number_format = money_format
 
 # ============================================
-# SHEET 8: THE MONEY RULES
+# WORKBOOK ASSEMBLY
 # ============================================
-ws8 = wb.create_sheet("Money Rules")
-
-ws8['A1'] = "📚 JOSHUA'S MONEY MANAGEMENT RULES"
-ws8['A1'].font = Font(bold=True, size=16, color="2E75B6")
-ws8.merge_cells('A1:E1')
-
-rules = [
-    "",
-    "🎯 THE PRIORITY ORDER (Pay Yourself First)",
-    "────────────────────────────────────",
-    "1. Fixed expenses MUST be covered (rent, utilities, food)",
-    "2. Credit card debt gets eliminated (4 months then done!)",
-    "3. Roth IRA gets maxed ($583.33/month - tax-free forever)",
-    "4. Emergency fund grows ($750/month until $15k)",
-    "5. Brokerage for extra wealth building",
-    "6. Fun money LAST (but don't skip it - burnout is real)",
-    "",
-    "💡 KEY INSIGHTS FROM YOUR NUMBERS",
-    "────────────────────────────────────",
-    "• Your employer gives you FREE 8% 401k match = ~$6,080/year FREE MONEY",
-    "• You're already saving 8% in Roth 401k + HSA from paycheck",
-    "• Total retirement savings: ~24% of gross (excellent!)",
-    "• After CC payoff, you'll have $230 extra/month",
-    "",
-    "⚠️ WARNING SIGNS TO WATCH",
-    "────────────────────────────────────",
-    "• Fun spending hitting $308? That's eating into savings",
-    "• Work expense float > 1 paycheck? Delay discretionary spending",
-    "• Skipping Roth IRA contribution? You lose that year's limit forever",
-    "",
-    "🏆 YOUR FINANCIAL SUPERPOWERS",
-    "────────────────────────────────────",
-    "• Young + high savings rate = compound interest machine",
-    "• HSA = triple tax advantage (pre-tax in, grows tax-free, tax-free out for medical)",
-    "• Roth IRA = flexibility (contributions out anytime, $10k for house)",
-    "• Employer match = instant 100% return on investment",
-    "",
-    "📊 THE MATH THAT MATTERS",
-    "────────────────────────────────────",
-    "• $583/month in Roth IRA for 30 years @ 7% = ~$700,000",
-    "• That $308 fun spending? Over 30 years @ 7% = ~$370,000 opportunity cost",
-    "• Every $1 saved in your 20s = ~$7.60 at retirement (7% for 30 years)",
-    "",
-    "🎮 GAMIFY YOUR FINANCES",
-    "────────────────────────────────────",
-    "• Set monthly 'high scores' for savings",
-    "• Celebrate milestones (first $1k, $5k, $10k in emergency fund)",
-    "• Track your net worth monthly - watch it grow!",
+# Everything chart_series() reads besides config
+CHART_SECTIONS = ('budgetTransactions', 'customCategories', 'paychecks',
+                  'creditCard', 'emergencyFundBalance', 'savingsFunds')
+
+# Sheet title, builder, and the BudgetState sections each sheet reads.
+# The watch mode (watch_budget.py) uses the sections to rebuild only the
+# sheets affected by an edit.
+SHEETS = [
+    ("Dashboard", build_dashboard, ('config',) + CHART_SECTIONS),
+    ("Monthly Budget", build_monthly_budget, ('config', 'creditCard')),
+    ("Roth IRA Tracker", build_roth_ira_tracker, ('config', 'rothIraContributions')),
+    ("Credit Card Payoff", build_credit_card_payoff, ('creditCard',)),
+    ("Work Expenses", build_work_expenses, ('config', 'workExpenses')),
+    ("Emergency Fund", build_emergency_fund, ('config', 'emergencyFundBalance', 'emergencyFundEntries')),
+    ("Paycheck Tracker", build_paycheck_tracker, ('config', 'paychecks')),
+    ("Money Rules", build_money_rules, ('config', 'creditCard')),
+    ("Net Worth Trend", build_net_worth_trend, ('creditCard', 'emergencyFundBalance', 'savingsFunds')),
+    ("Chart Data", build_chart_data, ('config',) + CHART_SECTIONS),
 ]
 
-for r, rule in enumerate(rules, 2):
-    ws8.cell(row=r, column=1, value=rule)
-    ws8.merge_cells(f'A{r}:E{r}')
-    if '🎯' in rule or '💡' in rule or '⚠️' in rule or '🏆' in rule or '📊' in rule or '🎮' in rule:
-        ws8.cell(row=r, column=1).font = Font(bold=True, size=12)
-    if '────' in rule:
-        ws8.cell(row=r, column=1).font = Font(color="AAAAAA")
-
-ws8.column_dimensions['A'].width = 70
-
-# Save workbook
-output_path = r"c:\Users\joshua.torres\OneDrive - Sierra-Cedar\Documents\Claude Projects\Budget\Budget_Master.xlsx"
-wb.save(output_path)
-print("Budget spreadsheet created successfully!")
-print(f"Saved to: {output_path}")
-print("\nSheets created:")
-for sheet in wb.sheetnames:
-    print(f"  - {sheet}")
+def sheets_for_sections(sections):
+    """Titles of the sheets that read any of the given BudgetState sections."""
+    sections = set(sections)
+    return [title for title, _, reads in SHEETS if sections.intersection(reads)]
+
+def read_net_worth_history(history_path):
+    """Every change point in the history file, or [] if there isn't one yet."""
+    if history_path is None or not os.path.exists(history_path):
+        return []
+    with NetWorthHistory(history_path) as history:
+        first = history.first_day()
+        return history.range(first, history.latest_day()) if first else []
+
+def derive(state, history_path):
+    """Values several sheets need, worked out once per build."""
+    history = read_net_worth_history(history_path)
+    return {'history': history, 'charts': chart_series(state, history)}
+
+def create_workbook(state=None, history_path=None):
+    if state is None:
+        state = copy.deepcopy(DEFAULT_STATE)
+    derived = derive(state, history_path)
+    wb = Workbook()
+    wb.remove(wb.active)
+    for title, build, _ in SHEETS:
+        build(wb.create_sheet(title), state, derived)
+    return wb
+
+def rebuild_sheets(wb, titles, state, history_path=None):
+    """Replace the named sheets in place, keeping the workbook's sheet order."""
+    derived = derive(state, history_path)
+    for title, build, _ in SHEETS:
+        if title not in titles:
+            continue
+        index = wb.sheetnames.index(title)
+        wb.remove(wb[title])
+        build(wb.create_sheet(title, index), state, derived)
+    wb.active = 0
+
+def record_net_worth(state, history_path, day=None):
+    """Add today's account balances to the net worth history."""
+    with NetWorthHistory(history_path) as history:
+        if day is None:
+            day = date.today()
+            latest = history.latest_day()
+            if latest is not None and day < latest:
+                # The clock went backwards (or was ahead last time). Update the
+                # latest snapshot rather than fail the whole build.
+                print(f"Warning: today ({day}) is before the last net worth snapshot ({latest}); "
+                      f"recording against {latest}")
+                day = latest
+        history.record(day, balances_from_state(state))
+
+def save_workbook(wb, path):
+    """Save via a temp file in the same folder + rename, so Excel never sees a half-written file."""
+    path = os.path.abspath(path)
+    tmp_path = os.path.join(os.path.dirname(path), f'.~{os.getpid()}.{os.path.basename(path)}')
+    if os.path.exists(tmp_path):  # left behind by a crashed run
+        os.remove(tmp_path)
+    try:
+        # Create the temp file with open() rather than mkstemp() so it gets the
+        # usual umask permissions instead of 0600, and keep an existing
+        # workbook's permissions the way a plain wb.save() would
+        with open(tmp_path, 'xb') as f:
+            wb.save(f)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Budget Master workbook.")
+    parser.add_argument('data', nargs='?', help="path to the app's budget-data.json")
+    parser.add_argument('--output', help=f"workbook to write (default: {OUTPUT_NAME} next to the data file)")
+    args = parser.parse_args()
+
+    state = history_path = None
+    if args.data:
+        state = load_state(args.data)
+        history_path = history_path_for(args.data)
+        record_net_worth(state, history_path)
+    wb = create_workbook(state, history_path)
+
+    # Save workbook
+    output_path = args.output or output_path_for(args.data)
+    save_workbook(wb, output_path)
+    print("Budget spreadsheet created successfully!")
+    print(f"Saved to: {output_path}")
+    print("\nSheets created:")
+    for sheet in wb.sheetnames:
+        print(f"  - {sheet}")
@@ -0,0 +1,191 @@
+"""
+Net Worth History
+Local store of dated account balances for the "Net Worth Trend" sheet
+
+Each snapshot is stored as a delta against the previous one (only accounts
+whose balance changed, with None for accounts that went away). Every
+KEYFRAME_INTERVAL snapshots a full copy is written instead, so an as-of
+lookup never replays more than that many rows. Snapshots that match the
+previous one aren't stored at all - balances carry forward until they change.
+
+Rows live in a SQLite table keyed by (household, day), so date lookups and
+range scans go straight through the primary key.
+"""
+
+import json
+import sqlite3
+from bisect import bisect_right
+from datetime import date
+from pathlib import Path
+
+KEYFRAME_INTERVAL = 64
+
+
+def _to_cents(balances):
+    return {name: round(amount * 100) for name, amount in balances.items()}
+
+
+def _to_dollars(cents):
+    return {name: amount / 100 for name, amount in cents.items()}
+
+
+def _apply(balances, delta):
+    for name, amount in delta.items():
+        if amount is None:
+            balances.pop(name, None)
+        else:
+            balances[name] = amount
+
+
+def _diff(old, new):
+    delta = {name: amount for name, amount in new.items() if old.get(name) != amount}
+    delta.update({name: None for name in old if name not in new})
+    return delta
+
+
+def history_path_for(data_path):
+    """The history file lives next to the budget-data.json it records."""
+    return Path(data_path).with_name('net_worth_history.db')
+
+
+def balances_on(points, day):
+    """Balances in effect on `day`, given the (day, balances) list from range()."""
+    i = bisect_right(points, day.toordinal(), key=lambda point: point[0].toordinal())
+    return points[i - 1][1] if i else {}
+
+
+def balances_from_state(state):
+    """Current balance of every account in a BudgetState, debts negative."""
+    balances = {}
+    funds = state.get('savingsFunds') or []
+    for fund in funds:
+        balances[f"fund:{fund['id']}"] = fund['balance']
+    # The app's default funds include the emergency fund itself; don't count it twice
+    if not any(fund['id'] == 'emergency' for fund in funds):
+        balances['emergencyFund'] = state.get('emergencyFundBalance', 0)
+    credit_card = state.get('creditCard')
+    if credit_card:
+        paid = sum(p['amount'] for p in credit_card.get('payments', []) if p.get('paid'))
+        balances['creditCard'] = -max(credit_card['totalAmount'] - paid, 0)
+    return balances
+
+
+def account_labels(state, accounts=()):
+    """Display names for the keys produced by balances_from_state.
+
+    Any of `accounts` no longer in the state (a fund that has since been
+    deleted) gets a name built from its key, e.g. "Vacation (closed)".
+    """
+    labels = {'emergencyFund': 'Emergency Fund', 'creditCard': 'Credit Card'}
+    for fund in state.get('savingsFunds') or []:
+        labels[f"fund:{fund['id']}"] = fund['name']
+    for name in accounts:
+        if name not in labels:
+            readable = name.removeprefix('fund:').replace('-', ' ').replace('_', ' ').title()
+            labels[name] = f"{readable} (closed)"
+    return labels
+
+
+class NetWorthHistory:
+    def __init__(self, path, household='default', keyframe_interval=KEYFRAME_INTERVAL):
+        self.household = household
+        self.keyframe_interval = keyframe_interval
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                household TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                is_full INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (household, day)
+            ) WITHOUT ROWID
+        """)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _cents_as_of(self, ordinal):
+        keyframe = self.db.execute(
+            "SELECT day, data FROM snapshots WHERE household = ? AND day <= ? AND is_full = 1"
+            " ORDER BY day DESC LIMIT 1",
+            (self.household, ordinal),
+        ).fetchone()
+        if keyframe is None:
+            return {}
+        balances = json.loads(keyframe[1])
+        for (data,) in self.db.execute(
+            "SELECT data FROM snapshots WHERE household = ? AND day > ? AND day <= ? ORDER BY day",
+            (self.household, keyframe[0], ordinal),
+        ):
+            _apply(balances, json.loads(data))
+        return balances
+
+    def first_day(self):
+        row = self.db.execute(
+            "SELECT MIN(day) FROM snapshots WHERE household = ?", (self.household,)
+        ).fetchone()
+        return date.fromordinal(row[0]) if row[0] is not None else None
+
+    def latest_day(self):
+        row = self.db.execute(
+            "SELECT MAX(day) FROM snapshots WHERE household = ?", (self.household,)
+        ).fetchone()
+        return date.fromordinal(row[0]) if row[0] is not None else None
+
+    def record(self, day, balances):
+        """Store the balances for `day`; re-recording the latest day replaces it."""
+        ordinal = day.toordinal()
+        latest = self.latest_day()
+        if latest is not None and day < latest:
+            raise ValueError(f"Can't record {day}: history already runs to {latest}")
+
+        with self.db:
+            if latest == day:
+                self.db.execute(
+                    "DELETE FROM snapshots WHERE household = ? AND day = ?", (self.household, ordinal)
+                )
+            new = _to_cents(balances)
+            previous = self._cents_as_of(ordinal - 1)
+            delta = _diff(previous, new)
+            if not delta and (previous or not new):
+                # Nothing changed - or nothing to record yet (an empty first
+                # snapshot would only start the history with a blank row)
+                return
+
+            since_keyframe = self.db.execute(
+                "SELECT COUNT(*) FROM snapshots WHERE household = ? AND day > COALESCE("
+                " (SELECT MAX(day) FROM snapshots WHERE household = ? AND is_full = 1), -1)",
+                (self.household, self.household),
+            ).fetchone()[0]
+            is_full = not previous or since_keyframe + 1 >= self.keyframe_interval
+            self.db.execute(
+                "INSERT INTO snapshots (household, day, is_full, data) VALUES (?, ?, ?, ?)",
+                (self.household, ordinal, int(is_full),
+                 json.dumps(new if is_full else delta, separators=(',', ':'))),
+            )
+
+    def as_of(self, day):
+        """Balances in effect on `day` (the latest snapshot on or before it)."""
+        return _to_dollars(self._cents_as_of(day.toordinal()))
+
+    def range(self, start, end):
+        """(day, balances) at `start` and at every change up to and including `end`."""
+        balances = self._cents_as_of(start.toordinal())
+        result = [(start, _to_dollars(balances))] if balances else []
+        for day, is_full, data in self.db.execute(
+            "SELECT day, is_full, data FROM snapshots WHERE household = ? AND day > ? AND day <= ?"
+            " ORDER BY day",
+            (self.household, start.toordinal(), end.toordinal()),
+        ):
+            if is_full:
+                balances = json.loads(data)
+            else:
+                _apply(balances, json.loads(data))
+            result.append((date.fromordinal(day), _to_dollars(balances)))
+        return result
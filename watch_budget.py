@@ -0,0 +1,176 @@
+"""
+Budget Master Watch Mode
+Keeps the workbook in sync with the desktop app's budget-data.json
+
+The app rewrites the whole data file on every edit, so this watches the file,
+waits for a burst of saves to settle, works out which BudgetState sections
+actually changed and rebuilds only the sheets that read them.
+
+    python watch_budget.py [--data budget-data.json] [--output Budget_Master.xlsx]
+                           [--history net_worth_history.db]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from create_budget import (
+    DEFAULT_STATE, OUTPUT_NAME, create_workbook, load_state, output_path_for,
+    rebuild_sheets, record_net_worth, save_workbook, sheets_for_sections,
+)
+from networth_history import history_path_for
+
+POLL_INTERVAL = 1.0   # seconds between stat() checks while idle
+DEBOUNCE = 0.75       # file must be unchanged this long before we rebuild
+SAVE_RETRY_MAX = 60   # longest wait between attempts to save a locked workbook
+
+
+def default_data_path():
+    """Same location as get_data_path() in budget-app/src-tauri/src/lib.rs."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Application Support'
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or Path.home() / '.local' / 'share'
+    return Path(base) / 'BudgetMaster' / 'budget-data.json'
+
+
+def section_hashes(state):
+    """Fingerprint each top-level BudgetState section so edits can be diffed cheaply."""
+    return {
+        key: hashlib.sha1(json.dumps(state[key], sort_keys=True).encode('utf-8')).hexdigest()
+        for key in DEFAULT_STATE
+    }
+
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class BudgetWatcher:
+    def __init__(self, data_path, output_path, poll_interval=POLL_INTERVAL, debounce=DEBOUNCE,
+                 history_path=None):
+        self.data_path = Path(data_path)
+        self.output_path = Path(output_path)
+        self.history_path = Path(history_path) if history_path else history_path_for(self.data_path)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.wb = None
+        self.hashes = {}
+        self.signature = None
+        self.unsaved = False
+        self.save_retry_delay = 0
+        self.save_retry_at = 0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if self.unsaved and loop.time() >= self.save_retry_at:
+                await self._save()
+            signature = file_signature(self.data_path)
+            if signature is not None and signature != self.signature:
+                signature = await self._wait_until_settled(signature)
+                await self._refresh(signature)
+            # Plain sleep between stat() calls keeps the process idle between edits
+            await asyncio.sleep(self.poll_interval)
+
+    async def _wait_until_settled(self, signature):
+        while True:
+            await asyncio.sleep(self.debounce)
+            latest = file_signature(self.data_path)
+            if latest == signature:
+                return signature
+            signature = latest
+
+    async def _refresh(self, signature):
+        try:
+            state = load_state(self.data_path)
+        except (OSError, ValueError) as e:
+            # Most likely caught the app mid-write; the next save will retrigger us
+            print(f"Skipping unreadable data file: {e}")
+            self.signature = signature
+            return
+
+        hashes = section_hashes(state)
+        if self.wb is None:
+            titles = None
+        else:
+            changed = [key for key in hashes if hashes[key] != self.hashes.get(key)]
+            titles = sheets_for_sections(changed)
+            if not titles:
+                self.hashes = hashes
+                self.signature = signature
+                return
+
+        try:
+            await asyncio.to_thread(self._build, state, titles)
+        except Exception as e:
+            # Bad data (e.g. a fund with no balance). The cached workbook may be
+            # half rebuilt, so drop it, and wait for the next save rather than
+            # rebuilding the same data over and over.
+            print(f"Couldn't build the workbook: {e!r} - waiting for the next change")
+            self.wb = None
+            self.hashes = {}
+            self.signature = signature
+            return
+        self.hashes = hashes
+        self.signature = signature
+        if titles is None:
+            print(f"Built {self.output_path}")
+        else:
+            print(f"Updated {', '.join(titles)}")
+        self.save_retry_delay = 0
+        await self._save()
+
+    def _build(self, state, titles):
+        record_net_worth(state, self.history_path)
+        if titles is None:
+            self.wb = create_workbook(state, self.history_path)
+        else:
+            rebuild_sheets(self.wb, titles, state, self.history_path)
+
+    async def _save(self):
+        try:
+            await asyncio.to_thread(save_workbook, self.wb, self.output_path)
+        except OSError as e:
+            # Usually Excel holding the workbook open on Windows. Keep the built
+            # workbook and retry just the save, backing off while it stays locked.
+            self.unsaved = True
+            self.save_retry_delay = min(max(self.save_retry_delay * 2, self.poll_interval), SAVE_RETRY_MAX)
+            self.save_retry_at = asyncio.get_running_loop().time() + self.save_retry_delay
+            print(f"Couldn't save {self.output_path}: {e} - retrying in {self.save_retry_delay:g}s")
+            return
+        if self.unsaved:
+            print(f"Saved {self.output_path}")
+        self.unsaved = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the budget workbook whenever budget-data.json changes.")
+    parser.add_argument('--data', default=default_data_path(), help="path to budget-data.json")
+    parser.add_argument('--output', help=f"workbook to write (default: {OUTPUT_NAME} next to the data file)")
+    parser.add_argument('--history', help="net worth history file (default: next to the data file)")
+    parser.add_argument('--poll', type=float, default=POLL_INTERVAL, help="seconds between file checks")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE, help="quiet period before rebuilding")
+    args = parser.parse_args()
+
+    watcher = BudgetWatcher(args.data, args.output or output_path_for(args.data), args.poll, args.debounce,
+                            args.history)
+    print(f"Watching {watcher.data_path} (Ctrl+C to stop)")
+    try:
+        asyncio.run(watcher.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()